@@ -7,17 +7,37 @@ Optimized for Apple Silicon:
 """
 
 import argparse
-import json
+import fcntl
+import functools
+import importlib
 import os
+import queue
+import shutil
 import signal
 import subprocess
 import sys
 import tempfile
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor
+import wave
+from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import IO, DefaultDict, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import orjson
+
+SAMPLE_RATE = 16000
+# ~16 s of 16kHz mono float32 per chunk; at most DECODE_QUEUE_SIZE chunks wait on the WAV writer.
+DECODE_CHUNK_BYTES = 1 << 20
+DECODE_QUEUE_SIZE = 8
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+FFMPEG = shutil.which("ffmpeg") or "ffmpeg"
+FFPROBE = shutil.which("ffprobe") or "ffprobe"
+# Punctuation-only segments mlx-whisper emits on silence.
+_JUNK = frozenset({"!", ".", "?", "...", "！", "。", "？"})
 
 
 @dataclass
@@ -32,6 +52,8 @@ class TranscriptionConfig:
     quiet: bool = False
     stream_progress: bool = False
     senko_warmup: bool = False
+    quantized: bool = False
+    print_result: bool = True
 
 
 def log(message: str, quiet: bool = False) -> None:
@@ -39,33 +61,85 @@ def log(message: str, quiet: bool = False) -> None:
         print(message, file=sys.stderr, flush=True)
 
 
-def progress(stage: str, percent: int, message: str) -> None:
-    """Output progress in JSON format for streaming."""
-    payload = json.dumps(
-        {"type": "progress", "stage": stage, "percent": percent, "message": message},
-        ensure_ascii=False,
-    )
-    print(f"PROGRESS:{payload}", flush=True)
+PROGRESS_FLUSH_INTERVAL = 0.1
+
+_progress_lock = threading.RLock()
+_progress_pending: List[bytes] = []
+_progress_stage: Optional[str] = None
+_progress_percent = 0
+_progress_last_flush = 0.0
+_progress_timer: Optional[threading.Timer] = None
+
+
+def flush_progress() -> None:
+    """Write any buffered progress lines to stdout in a single write."""
+    global _progress_last_flush, _progress_timer
+    with _progress_lock:
+        if _progress_timer is not None:
+            _progress_timer.cancel()
+            _progress_timer = None
+        if not _progress_pending:
+            return
+        sys.stdout.flush()  # keep ordering with text-mode prints
+        sys.stdout.buffer.write(b"".join(_progress_pending))
+        sys.stdout.buffer.flush()
+        _progress_pending.clear()
+        _progress_last_flush = time.monotonic()
+
+
+def progress(stage: str, percent: Optional[int], message: str) -> None:
+    """Output progress in JSON format for streaming.
+
+    A ``percent`` of None repeats the last reported value, for stages such as
+    diarization that run alongside transcription and should not move the bar.
+    Stage transitions are written immediately; updates within a stage are
+    batched so stdout is flushed at most every PROGRESS_FLUSH_INTERVAL seconds.
+    """
+    global _progress_stage, _progress_percent, _progress_timer
+    with _progress_lock:
+        if percent is not None:
+            _progress_percent = percent
+        payload = orjson.dumps(
+            {"type": "progress", "stage": stage, "percent": _progress_percent, "message": message}
+        )
+        _progress_pending.append(b"PROGRESS:" + payload + b"\n")
+        elapsed = time.monotonic() - _progress_last_flush
+        if stage != _progress_stage or elapsed >= PROGRESS_FLUSH_INTERVAL:
+            _progress_stage = stage
+            flush_progress()
+        elif _progress_timer is None:
+            _progress_timer = threading.Timer(PROGRESS_FLUSH_INTERVAL - elapsed, flush_progress)
+            _progress_timer.daemon = True
+            _progress_timer.start()
 
 
 current_segments: List[Dict] = []
 current_metadata: Dict = {}
 interrupted = False
+# Reentrant so the signal handler can take it on the main thread while held there.
+state_lock = threading.RLock()
 
 
 def signal_handler(sig, frame) -> None:
     """Handle interrupt signals to save partial progress."""
     del sig, frame  # unused, required by signal API
     global interrupted
-    if not interrupted:
+    with state_lock:
+        already_interrupted = interrupted
         interrupted = True
+    if not already_interrupted:
         progress("interrupt", 0, "正在停止并保存进度...")
     else:
         sys.exit(1)
 
 
-signal.signal(signal.SIGINT, signal_handler)
-signal.signal(signal.SIGTERM, signal_handler)
+# Only the main thread may install handlers; skip when imported from a worker.
+if threading.current_thread() is threading.main_thread():
+    try:
+        signal.signal(signal.SIGINT, signal_handler)
+        signal.signal(signal.SIGTERM, signal_handler)
+    except ValueError:
+        pass
 
 
 def safe_unlink(file_path: Optional[str]) -> None:
@@ -76,37 +150,134 @@ def safe_unlink(file_path: Optional[str]) -> None:
             pass
 
 
-def convert_to_wav(audio_path: str, stream: bool = False) -> str:
-    """Convert audio to 16kHz mono WAV for senko."""
+def create_temp_wav() -> IO[bytes]:
+    """Create the temporary WAV senko will read, under TMPDIR (or /tmp)."""
+    temp_file = tempfile.NamedTemporaryFile(
+        dir=os.environ.get("TMPDIR") or "/tmp", suffix=".wav", delete=False
+    )
+    # The WAV is read once by senko; keep it out of the page cache on macOS.
+    if hasattr(fcntl, "F_NOCACHE"):
+        fcntl.fcntl(temp_file.fileno(), fcntl.F_NOCACHE, 1)
+    return temp_file
+
+
+def _write_wav_chunks(
+    wav_file: IO[bytes], chunks: "queue.Queue[Optional[bytes]]", errors: List[BaseException]
+) -> None:
+    """Append float32 chunks to a 16kHz mono 16-bit WAV as they arrive.
+
+    senko.Diarizer.diarize only accepts a file path, so the WAV is written from
+    the shared decode instead of having ffmpeg decode the source again. On
+    failure the queue is still drained so the decoder never blocks.
+    """
+    try:
+        with wav_file, wave.open(wav_file, "wb") as wav_writer:
+            wav_writer.setnchannels(1)
+            wav_writer.setsampwidth(2)
+            wav_writer.setframerate(SAMPLE_RATE)
+            while True:
+                chunk = chunks.get()
+                if chunk is None:
+                    return
+                samples = np.frombuffer(chunk, dtype=np.float32)
+                scaled = np.multiply(samples, 32767.0, dtype=np.float32)
+                np.clip(scaled, -32767.0, 32767.0, out=scaled)
+                # Round like ffmpeg's float-to-s16 conversion rather than truncating.
+                np.rint(scaled, out=scaled)
+                # Raw writes skip the per-chunk header patch; close() patches it once.
+                wav_writer.writeframesraw(scaled.astype("<i2"))
+    except Exception as exc:
+        errors.append(exc)
+        while chunks.get() is not None:
+            pass
+
+
+def decode_audio(
+    audio_path: str, stream: bool = False, wav_file: Optional[IO[bytes]] = None
+) -> np.ndarray:
+    """Decode audio once to 16kHz mono float32 samples shared by all stages.
+
+    ffmpeg output is read in chunks; when ``wav_file`` is given, each chunk is
+    also handed to a writer thread so the WAV for senko is complete as soon as
+    decoding finishes.
+    """
     if stream:
         progress("converting", 5, "正在转换音频格式...")
 
-    temp_wav = tempfile.NamedTemporaryFile(suffix=".wav", delete=False).name
     command = [
-        "ffmpeg",
+        FFMPEG,
+        "-nostdin",
         "-i",
         audio_path,
         "-ar",
-        "16000",
+        str(SAMPLE_RATE),
         "-ac",
         "1",
         "-f",
-        "wav",
-        "-y",
-        temp_wav,
+        "f32le",
+        "-",
     ]
-    proc = subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+    try:
+        proc = subprocess.Popen(
+            command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, close_fds=False
+        )
+    except OSError:
+        if wav_file is not None:
+            wav_file.close()
+        raise
+    stderr_chunks: List[bytes] = []
+    stderr_reader = threading.Thread(
+        target=lambda: stderr_chunks.append(proc.stderr.read()), daemon=True
+    )
+    stderr_reader.start()
+
+    chunks: "queue.Queue[Optional[bytes]]" = queue.Queue(maxsize=DECODE_QUEUE_SIZE)
+    writer_errors: List[BaseException] = []
+    writer = None
+    if wav_file is not None:
+        writer = threading.Thread(
+            target=_write_wav_chunks, args=(wav_file, chunks, writer_errors), daemon=True
+        )
+        writer.start()
+
+    buffer = bytearray()
+    try:
+        while True:
+            chunk = proc.stdout.read(DECODE_CHUNK_BYTES)
+            if not chunk:
+                break
+            buffer += chunk
+            if writer:
+                chunks.put(chunk)
+    finally:
+        if writer:
+            chunks.put(None)
+            writer.join()
+        proc.stdout.close()
+        proc.wait()
+        stderr_reader.join()
+
     if proc.returncode != 0:
-        safe_unlink(temp_wav)
-        error_line = proc.stderr.strip().splitlines()[-1] if proc.stderr else "ffmpeg failed"
+        stderr = b"".join(stderr_chunks).decode("utf-8", errors="replace").strip()
+        error_line = stderr.splitlines()[-1] if stderr else "ffmpeg failed"
         raise RuntimeError(f"Audio conversion failed: {error_line}")
-    return temp_wav
+    if writer_errors:
+        raise writer_errors[0]
+    return np.frombuffer(buffer, dtype=np.float32)
+
+
+@functools.lru_cache(maxsize=4)
+def resolve_model_source(model_size: str, quantized: bool = False) -> str:
+    """Prefer local model path to avoid repeated remote resolution.
 
+    With ``quantized``, a 4-bit ``mlx_models/<model>-q4`` conversion is used when present.
+    """
+    if quantized:
+        quantized_model = PROJECT_ROOT / "mlx_models" / f"{model_size}-q4"
+        if quantized_model.exists():
+            return str(quantized_model)
 
-def resolve_model_source(model_size: str) -> str:
-    """Prefer local model path to avoid repeated remote resolution."""
-    project_root = Path(__file__).resolve().parent.parent
-    local_model = project_root / "mlx_models" / model_size
+    local_model = PROJECT_ROOT / "mlx_models" / model_size
     if local_model.exists():
         return str(local_model)
 
@@ -119,12 +290,26 @@ def resolve_model_source(model_size: str) -> str:
     return model_map.get(model_size, "mlx-community/whisper-large-v3-mlx")
 
 
+def _load_model(model_source: str) -> None:
+    """Preload Whisper weights into mlx_whisper's model holder.
+
+    ModelHolder reuses the loaded model while the source stays the same, so
+    this only loads once per process and mlx_whisper.transcribe skips the load.
+    """
+    import mlx.core as mx
+    from mlx_whisper.transcribe import ModelHolder
+
+    # Same dtype mlx_whisper.transcribe uses with its default fp16=True.
+    ModelHolder.get_model(model_source, mx.float16)
+
+
 def run_transcription(
-    audio_path: str,
+    audio: Union[str, np.ndarray],
     model_size: str,
     language: Optional[str],
     quiet: bool,
     stream: bool = False,
+    quantized: bool = False,
 ) -> Tuple[List[Dict], float, str, str]:
     """Run mlx-whisper transcription."""
     global current_segments
@@ -134,42 +319,49 @@ def run_transcription(
     if language and language != "en" and model_size == "distil-large-v3":
         effective_model = "large-v3"
         if stream:
-            progress("transcription", 12, f"语言为 {language}，切换到多语言模型 large-v3...")
+            progress("transcription", 10, f"语言为 {language}，切换到多语言模型 large-v3...")
         else:
             log(f"Language is {language}, switching to multilingual model large-v3", quiet)
 
     if stream:
-        progress("transcription", 15, f"正在加载 {effective_model} 模型...")
+        progress("transcription", 12, f"正在加载 {effective_model} 模型...")
     else:
         log(f"Loading MLX-Whisper model: {effective_model}", quiet)
 
-    model_source = resolve_model_source(effective_model)
+    model_source = resolve_model_source(effective_model, quantized)
+    current_metadata["model_source"] = model_source
+    if quantized and not model_source.endswith("-q4"):
+        log(
+            f"No 4-bit weights at mlx_models/{effective_model}-q4, using {model_source}",
+            quiet,
+        )
+    _load_model(model_source)
     if stream:
-        progress("transcription", 20, "模型加载完成，开始转录...")
+        progress("transcription", 15, "模型加载完成，开始转录...")
 
     transcribe_start = time.time()
     transcribe_kwargs = {"path_or_hf_repo": model_source, "verbose": (not quiet and not stream)}
     if language:
         transcribe_kwargs["language"] = language
 
-    raw_result = mlx_whisper.transcribe(audio_path, **transcribe_kwargs)
+    raw_result = mlx_whisper.transcribe(audio, **transcribe_kwargs)
     transcribe_time = time.time() - transcribe_start
 
     if stream:
-        progress("transcription", 60, f"转录完成 ({transcribe_time:.1f}秒)")
+        progress("transcription", 90, f"转录完成 ({transcribe_time:.1f}秒)")
     else:
         log(f"Transcription complete in {transcribe_time:.1f}s", quiet)
 
     detected_language = raw_result.get("language") or language or "auto"
     segments = raw_result.get("segments", [])
-    current_segments = []
+    cleaned_segments: List[Dict] = []
 
     for seg in segments:
         if interrupted:
             break
         text = seg.get("text", "").strip()
-        if text and text not in ["!", ".", "?", "...", "！", "。", "？"]:
-            current_segments.append(
+        if text and text not in _JUNK:
+            cleaned_segments.append(
                 {
                     "start": round(float(seg.get("start", 0)), 2),
                     "end": round(float(seg.get("end", 0)), 2),
@@ -177,7 +369,10 @@ def run_transcription(
                 }
             )
 
-    return current_segments, transcribe_time, detected_language, effective_model
+    with state_lock:
+        current_segments = cleaned_segments
+
+    return cleaned_segments, transcribe_time, detected_language, effective_model
 
 
 def run_senko_diarization(
@@ -187,7 +382,7 @@ def run_senko_diarization(
     import senko
 
     if stream:
-        progress("diarization", 65, "正在加载说话人分离模型...")
+        progress("diarization", None, "正在加载说话人分离模型...")
     else:
         log("Loading Senko diarization model...", quiet)
 
@@ -195,7 +390,7 @@ def run_senko_diarization(
     diarizer = senko.Diarizer(device="auto", warmup=warmup, quiet=True)
 
     if stream:
-        progress("diarization", 70, "正在进行说话人分离...")
+        progress("diarization", None, "正在进行说话人分离...")
 
     result = diarizer.diarize(wav_path, generate_colors=False)
     diarize_time = time.time() - diarize_start
@@ -204,55 +399,88 @@ def run_senko_diarization(
     unique_speakers = len(set(seg.get("speaker", "?") for seg in speaker_segments))
 
     if stream:
-        progress("diarization", 85, f"分离完成：{unique_speakers}位说话人 ({diarize_time:.1f}秒)")
+        progress("diarization", None, f"分离完成：{unique_speakers}位说话人 ({diarize_time:.1f}秒)")
     else:
         log(f"Diarization complete: {unique_speakers} speakers in {diarize_time:.1f}s", quiet)
 
     return speaker_segments, diarize_time
 
 
+def _run_in_daemon_thread(func, *args) -> Future:
+    """Run ``func`` on a daemon thread so an interrupted run never waits for it."""
+    future: Future = Future()
+
+    def runner() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(func(*args))
+        except BaseException as exc:
+            future.set_exception(exc)
+
+    threading.Thread(target=runner, daemon=True).start()
+    return future
+
+
 def assign_speakers(segments: List[Dict], speaker_segments: List[Dict]) -> List[Dict]:
-    """Assign speakers to transcription segments in linear time."""
-    if not speaker_segments:
+    """Assign each segment the speaker with the largest time overlap.
+
+    Candidate speaker turns are located with ``searchsorted`` and overlaps are
+    computed for all (segment, turn) pairs at once, so cost is linear in the
+    number of segments, turns and overlapping pairs.
+    """
+    if not segments or not speaker_segments:
+        return segments
+
+    # Senko turns are normalized once; transcription segments already carry floats.
+    turns: List[Tuple[float, float, str]] = sorted(
+        (
+            (float(s.get("start", 0)), float(s.get("end", 0)), s.get("speaker", "SPEAKER_?"))
+            for s in speaker_segments
+        ),
+        key=lambda turn: turn[0],
+    )
+    spk_starts = np.fromiter((turn[0] for turn in turns), np.float64, len(turns))
+    spk_ends = np.fromiter((turn[1] for turn in turns), np.float64, len(turns))
+    spk_labels = np.array([turn[2] for turn in turns])
+    asr_starts = np.fromiter((seg["start"] for seg in segments), np.float64, len(segments))
+    asr_ends = np.fromiter((seg["end"] for seg in segments), np.float64, len(segments))
+
+    # Candidates for segment i are turns lo[i]:hi[i] -- those ending after it
+    # starts (running max keeps ends sorted) and starting before it ends.
+    lo = np.searchsorted(np.maximum.accumulate(spk_ends), asr_starts, side="right")
+    hi = np.searchsorted(spk_starts, asr_ends, side="left")
+    counts = np.maximum(hi - lo, 0)
+    total = int(counts.sum())
+    if total == 0:
         return segments
 
-    ordered_speaker_segments = sorted(speaker_segments, key=lambda s: float(s.get("start", 0)))
-    speaker_idx = 0
+    rows = np.repeat(np.arange(len(segments)), counts)
+    offsets = np.cumsum(counts) - counts
+    cols = lo[rows] + (np.arange(total) - offsets[rows])
+    overlap = np.minimum(asr_ends[rows], spk_ends[cols]) - np.maximum(
+        asr_starts[rows], spk_starts[cols]
+    )
 
-    for seg in segments:
-        seg_start = float(seg.get("start", 0))
-        seg_end = float(seg.get("end", 0))
-        best_speaker = None
-        best_overlap = 0.0
-
-        while (
-            speaker_idx < len(ordered_speaker_segments)
-            and float(ordered_speaker_segments[speaker_idx].get("end", 0)) <= seg_start
-        ):
-            speaker_idx += 1
-
-        probe_idx = speaker_idx
-        while (
-            probe_idx < len(ordered_speaker_segments)
-            and float(ordered_speaker_segments[probe_idx].get("start", 0)) < seg_end
-        ):
-            speaker_seg = ordered_speaker_segments[probe_idx]
-            speaker_start = float(speaker_seg.get("start", 0))
-            speaker_end = float(speaker_seg.get("end", 0))
-            overlap = max(0.0, min(seg_end, speaker_end) - max(seg_start, speaker_start))
-            if overlap > best_overlap:
-                best_overlap = overlap
-                best_speaker = speaker_seg.get("speaker", "SPEAKER_?")
-            probe_idx += 1
-
-        if best_speaker:
-            seg["speaker"] = best_speaker
+    # Keep the first candidate reaching each segment's maximum positive overlap.
+    best = np.full(len(segments), -np.inf)
+    np.maximum.at(best, rows, overlap)
+    winners = (overlap > 0) & (overlap == best[rows])
+    winner_rows, first = np.unique(rows[winners], return_index=True)
+    winner_labels = spk_labels[cols[winners][first]]
+
+    for row, label in zip(winner_rows.tolist(), winner_labels.tolist()):
+        segments[row]["speaker"] = label
 
     return segments
 
 
 def format_time(seconds: float) -> str:
-    total = max(0, int(round(seconds)))
+    return _format_whole_seconds(max(0, int(round(seconds))))
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_whole_seconds(total: int) -> str:
     hours = total // 3600
     minutes = (total % 3600) // 60
     secs = total % 60
@@ -262,29 +490,44 @@ def format_time(seconds: float) -> str:
 
 
 def build_speaker_summary(segments: List[Dict]) -> List[Dict]:
-    summary: Dict[str, Dict[str, float]] = {}
+    # speaker -> [total duration, segment count]
+    summary: DefaultDict[str, List[float]] = defaultdict(lambda: [0.0, 0])
 
     for seg in segments:
         speaker = seg.get("speaker")
         if not speaker:
             continue
 
-        duration = max(0.0, float(seg.get("end", 0)) - float(seg.get("start", 0)))
-        stats = summary.setdefault(speaker, {"duration": 0.0, "segments": 0.0})
-        stats["duration"] += duration
-        stats["segments"] += 1
+        stats = summary[speaker]
+        stats[0] += max(0.0, seg["end"] - seg["start"])
+        stats[1] += 1
 
     return [
         {
             "id": speaker,
-            "segment_count": int(stats["segments"]),
-            "total_time": format_time(stats["duration"]),
+            "segment_count": int(segment_count),
+            "total_time": format_time(duration),
         }
-        for speaker, stats in sorted(summary.items())
+        for speaker, (duration, segment_count) in sorted(summary.items())
     ]
 
 
-def format_as_txt(segments: List[Dict], speakers: List[Dict], metadata: Dict) -> str:
+def _preformat_segments(segments: List[Dict]) -> List[Tuple[str, str, str, str]]:
+    """Format each segment's timestamps once as (start, end, speaker, text)."""
+    return [
+        (
+            format_time(seg["start"]),
+            format_time(seg["end"]),
+            seg.get("speaker", "Unknown"),
+            seg.get("text", ""),
+        )
+        for seg in segments
+    ]
+
+
+def format_as_txt(
+    segments: List[Tuple[str, str, str, str]], speakers: List[Dict], metadata: Dict
+) -> str:
     lines = []
     lines.append("=" * 60)
     lines.append("Audio Transcription Result")
@@ -305,17 +548,14 @@ def format_as_txt(segments: List[Dict], speakers: List[Dict], metadata: Dict) ->
 
     lines.append("Transcription:")
     lines.append("-" * 40)
-    for seg in segments:
-        start = format_time(float(seg.get("start", 0)))
-        end = format_time(float(seg.get("end", 0)))
-        speaker = seg.get("speaker", "Unknown")
-        text = seg.get("text", "")
-        lines.append(f"[{speaker}] ({start}-{end}) {text}")
+    lines.extend([f"[{speaker}] ({start}-{end}) {text}" for start, end, speaker, text in segments])
 
     return "\n".join(lines)
 
 
-def format_as_markdown(segments: List[Dict], speakers: List[Dict], metadata: Dict) -> str:
+def format_as_markdown(
+    segments: List[Tuple[str, str, str, str]], speakers: List[Dict], metadata: Dict
+) -> str:
     lines = ["# 转录结果", ""]
     lines.append("## 元数据")
     lines.append(f"- **语言**: {metadata.get('language', 'auto')}")
@@ -334,11 +574,7 @@ def format_as_markdown(segments: List[Dict], speakers: List[Dict], metadata: Dic
 
     lines.append("## 转录内容")
     lines.append("")
-    for seg in segments:
-        start = format_time(float(seg.get("start", 0)))
-        end = format_time(float(seg.get("end", 0)))
-        speaker = seg.get("speaker", "Unknown")
-        text = seg.get("text", "")
+    for start, end, speaker, text in segments:
         lines.append(f"**{speaker}** `{start}-{end}`")
         lines.append(f"> {text}")
         lines.append("")
@@ -346,16 +582,36 @@ def format_as_markdown(segments: List[Dict], speakers: List[Dict], metadata: Dic
     return "\n".join(lines)
 
 
+def _write_output(output_path: str, payload: bytes) -> None:
+    """Write bytes straight to the output file descriptor."""
+    fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(payload)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
 def probe_duration(audio_path: str) -> float:
     try:
         result = subprocess.run(
-            ["ffprobe", "-v", "quiet", "-show_format", "-print_format", "json", audio_path],
+            [
+                FFPROBE,
+                "-v",
+                "error",
+                "-show_entries",
+                "format=duration",
+                "-of",
+                "default=nw=1:nk=1",
+                audio_path,
+            ],
             capture_output=True,
             text=True,
             check=True,
+            close_fds=False,
         )
-        probe = json.loads(result.stdout)
-        return float(probe["format"].get("duration", 0))
+        return float(result.stdout.strip())
     except Exception:
         return 0.0
 
@@ -386,81 +642,115 @@ def transcribe(config: TranscriptionConfig) -> Dict:
     wav_path = None
 
     try:
-        wav_future = None
-        with ThreadPoolExecutor(max_workers=1) as executor:
+        diarize_future = None
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            # Warm the heavy imports while ffmpeg decodes; later imports hit sys.modules.
+            executor.submit(importlib.import_module, "mlx_whisper")
+            wav_file = None
             if config.enable_diarization:
-                wav_future = executor.submit(convert_to_wav, audio_path, stream)
-
+                executor.submit(importlib.import_module, "senko")
+                wav_file = create_temp_wav()
+                wav_path = wav_file.name
+            samples = decode_audio(audio_path, stream, wav_file)
+            # mlx-whisper runs on the GPU and senko on CoreML/ANE, so both stages overlap.
+            # Transcription stays on the main thread so a second signal can still stop it,
+            # and senko runs on a daemon thread so stopping never waits for it.
+            if wav_path and not interrupted:
+                diarize_future = _run_in_daemon_thread(
+                    run_senko_diarization, wav_path, quiet, stream, config.senko_warmup
+                )
             segments, transcribe_time, detected_language, effective_model = run_transcription(
-                audio_path, config.model_size, config.language, quiet, stream
-            )
-
-            if wav_future:
-                wav_path = wav_future.result()
-
-        current_metadata["transcription_time"] = transcribe_time
-        current_metadata["language"] = detected_language
-        current_metadata["model"] = effective_model
-
-        diarize_time = 0.0
-        speaker_segments: List[Dict] = []
-        if config.enable_diarization and wav_path and not interrupted:
-            speaker_segments, diarize_time = run_senko_diarization(
-                wav_path, quiet, stream, warmup=config.senko_warmup
+                samples, config.model_size, config.language, quiet, stream, config.quantized
             )
-            current_metadata["diarization_time"] = diarize_time
-            segments = assign_speakers(segments, speaker_segments)
-        elif config.enable_diarization and interrupted:
-            log("Skipping diarization due to interruption", quiet)
-
-        current_segments = segments
-        speakers = build_speaker_summary(segments)
-        current_metadata["speakers"] = [speaker["id"] for speaker in speakers]
-        current_metadata["total_time"] = time.time() - start_time
-
-        if stream:
-            progress("complete", 100, f"处理完成！用时 {current_metadata['total_time']:.1f}秒")
-
-        result = {
-            "success": True,
-            "file": os.path.basename(audio_path),
-            "model": effective_model,
-            "device": "Apple Silicon (MLX)",
-            "language": detected_language,
-            "duration": round(duration, 2),
-            "segments": segments,
-            "speakers": speakers,
-            "has_diarization": bool(config.enable_diarization),
-            "transcription": " ".join(seg.get("text", "") for seg in segments).strip(),
-            "is_partial": interrupted,
-            "metadata": current_metadata,
-        }
-
-        if config.output_format == "txt":
-            result["formatted_output"] = format_as_txt(segments, speakers, current_metadata)
-        elif config.output_format == "markdown":
-            result["formatted_output"] = format_as_markdown(segments, speakers, current_metadata)
-
-        if config.output_path:
-            with open(config.output_path, "w", encoding="utf-8") as f:
+            # Poll so an interrupt while waiting returns the transcription right away.
+            while diarize_future and not interrupted:
+                if wait([diarize_future], timeout=0.1).done:
+                    break
+
+            current_metadata["transcription_time"] = transcribe_time
+            current_metadata["language"] = detected_language
+            current_metadata["model"] = effective_model
+
+            if diarize_future and not interrupted:
+                speaker_segments, diarize_time = diarize_future.result()
+                current_metadata["diarization_time"] = diarize_time
+                segments = assign_speakers(segments, speaker_segments)
+            elif config.enable_diarization and interrupted:
+                log("Skipping diarization due to interruption", quiet)
+
+            with state_lock:
+                current_segments = segments
+            speakers = build_speaker_summary(segments)
+            current_metadata["speakers"] = [speaker["id"] for speaker in speakers]
+            current_metadata["total_time"] = time.time() - start_time
+
+            if stream:
+                progress("complete", 100, f"处理完成！用时 {current_metadata['total_time']:.1f}秒")
+
+            result = {
+                "success": True,
+                "file": os.path.basename(audio_path),
+                "model": effective_model,
+                "device": "Apple Silicon (MLX)",
+                "language": detected_language,
+                "duration": round(duration, 2),
+                "segments": segments,
+                "speakers": speakers,
+                "has_diarization": bool(config.enable_diarization),
+                "is_partial": interrupted,
+                "metadata": current_metadata,
+            }
+
+            # The flat transcription is derivable from segments; only JSON output carries it.
+            if config.output_format == "json":
+                result["transcription"] = " ".join([seg["text"] for seg in segments]).strip()
+            elif config.output_format in ("txt", "markdown"):
+                preformatted = _preformat_segments(segments)
+                formatter = format_as_txt if config.output_format == "txt" else format_as_markdown
+                result["formatted_output"] = formatter(preformatted, speakers, current_metadata)
+
+            json_options = orjson.OPT_SERIALIZE_NUMPY
+            write_future = None
+            payload = None
+            if config.output_path:
                 if config.output_format == "json":
-                    f.write(json.dumps(result, ensure_ascii=False, indent=2))
+                    payload = orjson.dumps(result, option=json_options | orjson.OPT_INDENT_2)
                 else:
-                    f.write(result.get("formatted_output", ""))
-
-        if stream:
-            print("RESULT:" + json.dumps(result, ensure_ascii=False), flush=True)
-        else:
-            print(json.dumps(result, ensure_ascii=False, indent=2))
-
-        return result
+                    payload = result.get("formatted_output", "").encode("utf-8")
+                # Write the file in the background while stdout is emitted below.
+                write_future = executor.submit(_write_output, config.output_path, payload)
+
+            if stream:
+                flush_progress()
+                print("RESULT:" + orjson.dumps(result, option=json_options).decode(), flush=True)
+            elif not config.print_result:
+                pass  # the caller prints the collected results
+            elif config.output_format == "json" or not config.output_path:
+                if config.output_format != "json" or payload is None:
+                    payload = orjson.dumps(result, option=json_options | orjson.OPT_INDENT_2)
+                print(payload.decode())
+            else:
+                # The formatted text already went to the output file; skip the JSON dump.
+                print(f"Saved {config.output_format} output to {config.output_path}")
+
+            if write_future:
+                write_future.result()
+            return result
     finally:
         safe_unlink(wav_path)
 
 
 def main() -> None:
     parser = argparse.ArgumentParser(description="Audio transcription with MLX-Whisper + Senko")
-    parser.add_argument("audio_path", help="Path to audio file")
+    parser.add_argument(
+        "audio_paths",
+        nargs="+",
+        metavar="audio_path",
+        help=(
+            "Path to audio file. Several files reuse one loaded model in this process; "
+            "their results are printed as one JSON array (or one RESULT line each with --stream)"
+        ),
+    )
     parser.add_argument(
         "--model",
         "-m",
@@ -498,29 +788,59 @@ def main() -> None:
         action="store_true",
         help="Warm up senko model (recommended only for repeated CLI runs)",
     )
+    parser.add_argument(
+        "--quantized",
+        action="store_true",
+        help="Prefer 4-bit weights from mlx_models/<model>-q4 when available",
+    )
 
     args = parser.parse_args()
+    if args.output and len(args.audio_paths) > 1:
+        parser.error("--output can only be used with a single audio file")
 
-    config = TranscriptionConfig(
-        audio_path=args.audio_path,
-        model_size=args.model,
-        language=args.language,
-        enable_diarization=args.diarize,
-        output_format=args.format,
-        output_path=args.output,
-        quiet=args.quiet,
-        stream_progress=args.stream,
-        senko_warmup=args.senko_warmup,
-    )
+    collect_results = len(args.audio_paths) > 1 and not args.stream
+    results: List[Dict] = []
+    failed = False
+    for audio_path in args.audio_paths:
+        if interrupted:
+            break
 
-    try:
-        transcribe(config)
-    except Exception as exc:
-        error_result = {"success": False, "error": str(exc)}
-        if config.stream_progress:
-            print("RESULT:" + json.dumps(error_result, ensure_ascii=False), flush=True)
-        else:
-            print(json.dumps(error_result, ensure_ascii=False, indent=2))
+        config = TranscriptionConfig(
+            audio_path=audio_path,
+            model_size=args.model,
+            language=args.language,
+            enable_diarization=args.diarize,
+            output_format=args.format,
+            output_path=args.output,
+            quiet=args.quiet,
+            stream_progress=args.stream,
+            senko_warmup=args.senko_warmup,
+            quantized=args.quantized,
+            print_result=not collect_results,
+        )
+
+        try:
+            results.append(transcribe(config))
+        except Exception as exc:
+            failed = True
+            error_result = {
+                "success": False,
+                "file": os.path.basename(audio_path),
+                "error": str(exc),
+            }
+            if collect_results:
+                results.append(error_result)
+            elif config.stream_progress:
+                flush_progress()
+                print("RESULT:" + orjson.dumps(error_result).decode(), flush=True)
+            else:
+                print(orjson.dumps(error_result, option=orjson.OPT_INDENT_2).decode())
+
+    if collect_results:
+        options = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+        print(orjson.dumps(results, option=options).decode())
+
+    if failed:
         sys.exit(1)
 
 